@@ -0,0 +1,41 @@
+"""预编译模拟数值核心
+
+在安装时运行一次:
+
+    python sim_core_build.py
+
+会在本目录生成 sim_core 扩展模块（sim_core.*.so / .pyd），test_game.py
+启动时会优先导入它。模块中记录了构建时核心源码和签名的指纹，与当前源码
+不一致（例如修改核心后没有重新构建）或找不到模块时，回退到 numba JIT
+或纯Python实现。
+"""
+import os
+
+# (gdp, inflation, unemployment, reserves, avg_tariff, total_demand, total_imports,
+#  tariffs, demand, eff_demand, imports, rand_u, retaliated)
+#   -> (gdp, inflation, unemployment, reserves, trade_balance, total_demand, total_imports)
+SIM_STEP_SIGNATURE = ("Tuple((f8, f8, f8, f8, f8, f8, f8))"
+                      "(f8, f8, f8, f8, f8, f8, f8, f8[:], f8[:], f8[:], f8[:], f8[:], b1[:])")
+
+
+def build():
+    """编译 sim_core 扩展模块"""
+    from numba.pycc import CC
+
+    from test_game import _sim_core_impl, _sim_core_fingerprint
+
+    cc = CC("sim_core")
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+    fingerprint = _sim_core_fingerprint()
+
+    def core_fingerprint():
+        return fingerprint
+
+    cc.export("sim_step", SIM_STEP_SIGNATURE)(_sim_core_impl)
+    cc.export("core_fingerprint", "i8()")(core_fingerprint)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
@@ -1,20 +1,149 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import matplotlib.pyplot as plt
+import matplotlib
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 import numpy as np
-import random
 import time
+import hashlib
+import inspect
+import warnings
+from collections import deque
 from typing import Dict, List, Tuple, Optional
 
+try:
+    from numba import njit
+except ImportError:  # 未安装numba时使用纯Python实现
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # 设置matplotlib支持中文显示
-plt.rcParams["font.family"] = ["SimHei", "WenQuanYi Micro Hei", "Heiti TC"]
-plt.rcParams["axes.unicode_minus"] = False  # 解决负号显示问题
+matplotlib.rcParams["font.family"] = ["SimHei", "WenQuanYi Micro Hei", "Heiti TC"]
+matplotlib.rcParams["axes.unicode_minus"] = False  # 解决负号显示问题
+
+# 贸易伙伴记录：关税税率、出口需求、进口额
+_PARTNER_DTYPE = np.dtype([("tariff", "f8"), ("demand", "f8"), ("imports", "f8")])
+
+# 全局共享的随机数生成器
+_RNG = np.random.default_rng()
+
+
+def seed_rng(seed: Optional[int] = None):
+    """重新设置随机数种子，使模拟结果可复现"""
+    global _RNG
+    _RNG = np.random.default_rng(seed)
+
+
+def _sim_core_impl(gdp, inflation, unemployment, reserves, avg_tariff, total_demand, total_imports,
+                   tariffs, demand, eff_demand, imports, rand_u, retaliated):
+    """一年经济模拟的数值核心
+
+    rand_u 为预先生成的 [0, 1) 均匀随机数：rand_u[0] 用于基础经济增长，
+    rand_u[1 + i] 用于第 i 个贸易伙伴的报复判定。eff_demand 为缓存的
+    demand * (1 - tariffs)，avg_tariff、total_demand 和 total_imports 为调用方
+    维护的平均关税、出口需求总额和进口总额。demand、eff_demand 和 imports
+    原地更新，实施报复的伙伴在 retaliated 中标记为 True。
+    返回 (gdp, inflation, unemployment, reserves, trade_balance, total_demand, total_imports)。
+    """
+    # 基础经济增长
+    base_gdp_growth = 1.0 + 2.0 * rand_u[0]
+    gdp_change = gdp * (base_gdp_growth / 100)
+
+    # 计算贸易平衡（对所有贸易伙伴整体做数组运算）
+    # 关税越高，出口需求越低（有效需求已缓存）
+    exports = eff_demand * 0.8  # 出口价值
+    # 关税收入
+    tariff_revenue = imports * tariffs
+    total_exports = exports.sum()
+    # 出口和关税收入对GDP的贡献
+    gdp_change += total_exports * 0.3 + tariff_revenue.sum() * 0.1
+
+    trade_balance = total_exports - total_imports
+
+    # 更新外汇储备
+    reserves += trade_balance
+
+    # 贸易平衡影响GDP
+    if trade_balance > 0:
+        gdp_change += trade_balance * 0.05  # 贸易顺差促进增长
+    else:
+        gdp_change -= abs(trade_balance) * 0.03  # 贸易逆差抑制增长
+
+    # 高关税可能导致国内通货膨胀
+    inflation_impact = avg_tariff * 2
+    inflation += inflation_impact - 0.5  # 随机波动
+
+    # 经济状况影响失业率（无分支写法：增长时下降，衰退时上升）
+    ratio = gdp_change / gdp
+    growing = (gdp_change > 0) * 1.0
+    unemployment_change = (-growing * min(0.5, ratio * 0.8)
+                           + (1.0 - growing) * max(0.5, -ratio * 1.2))
+    unemployment += unemployment_change
+
+    # 更新GDP
+    gdp += gdp_change
+
+    # 调整进口需求：经济增长会增加进口需求，通货膨胀会抑制进口需求
+    import_factor = (1 + gdp_change / gdp * 0.7) / (1 + inflation / 100 * 0.5)
+    imports *= import_factor
+    total_imports *= import_factor
+
+    # 调整出口需求（贸易伙伴的反馈）
+    for i in range(tariffs.shape[0]):
+        # 如果对某国关税过高，可能导致报复性关税
+        retaliated[i] = tariffs[i] > 0.25 and rand_u[1 + i] < min(0.7, (tariffs[i] - 0.2) * 5)
+        if retaliated[i]:
+            total_demand -= demand[i] * 0.2
+            demand[i] *= 0.8
+            eff_demand[i] *= 0.8
+
+    return gdp, inflation, unemployment, reserves, trade_balance, total_demand, total_imports
+
+
+def _sim_core_fingerprint() -> int:
+    """由核心源码和预编译签名计算的指纹，用于识别过期的 sim_core 扩展模块"""
+    from sim_core_build import SIM_STEP_SIGNATURE
+    source = inspect.getsource(_sim_core_impl) + SIM_STEP_SIGNATURE
+    return int(hashlib.sha1(source.encode("utf-8")).hexdigest()[:15], 16)
+
+
+def _load_sim_core():
+    """优先使用与当前源码一致的预编译核心（由 sim_core_build.py 生成），省去JIT编译时间"""
+    try:
+        import sim_core
+        fingerprint = _sim_core_fingerprint()
+    except (ImportError, OSError):
+        return njit(cache=True)(_sim_core_impl)
+
+    core_fingerprint = getattr(sim_core, "core_fingerprint", None)
+    if core_fingerprint is None or core_fingerprint() != fingerprint:
+        warnings.warn("sim_core 扩展模块与当前源码不一致，已改用JIT编译；"
+                      "请重新运行 python sim_core_build.py")
+        return njit(cache=True)(_sim_core_impl)
+    return sim_core.sim_step
+
+
+_sim_core = _load_sim_core()
 
 
 class Country:
     """表示一个国家，包含其经济指标和贸易政策"""
 
+    # 随机经济事件表（None 表示无事件）
+    _EVENT_NAMES = ("全球经济繁荣", "全球经济衰退", "技术突破", "自然灾害",
+                    "能源价格暴跌", "能源价格飙升", None)
+    _EVENT_WEIGHTS = np.array([0.1, 0.1, 0.15, 0.05, 0.1, 0.1, 0.45])
+    # 预先计算的累积概率，抽取事件时只需一次二分查找
+    _EVENT_CDF = np.cumsum(_EVENT_WEIGHTS) / _EVENT_WEIGHTS.sum()
+    # 各事件的影响: GDP变化比例区间、方向，以及失业率和通货膨胀率的变化
+    _EVENT_GDP_LO = np.array([0.02, 0.01, 0.015, 0.01, 0.01, 0.01, 0.0])
+    _EVENT_GDP_HI = np.array([0.04, 0.03, 0.035, 0.02, 0.025, 0.02, 0.0])
+    _EVENT_GDP_SIGN = np.array([1.0, -1.0, 1.0, -1.0, 1.0, -1.0, 0.0])
+    _EVENT_UNEMP = np.array([-0.7, 0.9, -0.5, 0.4, -0.3, 0.5, 0.0])
+    _EVENT_INFL = np.array([-0.5, 0.8, -0.3, 0.3, -1.2, 1.5, 0.0])
+
     def __init__(self, name: str, initial_gdp: float = 1000.0,
                  initial_unemployment: float = 5.0,
                  initial_inflation: float = 2.0):
@@ -23,128 +152,164 @@ class Country:
         self.unemployment = initial_unemployment  # 失业率（百分比）
         self.inflation = initial_inflation  # 通货膨胀率（百分比）
         self.foreign_reserves = 100.0  # 外汇储备（十亿美元）
-        self.trade_partners = {}  # 贸易伙伴及其关税税率 {国家名称: 关税税率}
-        self.export_demand = {}  # 对各国的出口需求 {国家名称: 需求值}
-        self.imports = {}  # 从各国的进口 {国家名称: 进口额}
+        # 贸易数据按伙伴下标存放在一个结构化数组中 {国家名称: 下标}
+        self._name_to_idx: Dict[str, int] = {}
+        self._partners = np.zeros(0, dtype=_PARTNER_DTYPE)
+        # 缓存的有效出口需求 demand * (1 - tariff)，只在关税或需求变化时更新
+        self._eff_demand = np.zeros(0, dtype=np.float64)
+        # 关税、出口需求和进口额的累计值，只在对应数据变化时增量更新
+        self._sum_tariff = 0.0
+        self._sum_demand = 0.0
+        self._sum_imports = 0.0
         self.year = 1  # 当前游戏年份
 
-        # 用于绘图的数据历史
-        self.gdp_history = [initial_gdp]
-        self.unemployment_history = [initial_unemployment]
-        self.inflation_history = [initial_inflation]
-        self.trade_balance_history = [0]
+        # 用于绘图的数据历史（预分配数组，前 _hist_len 项有效）
+        # 只用于绘图，float32精度足够；当前指标仍以Python浮点数保存
+        self._cap = 128
+        self.gdp_history = np.empty(self._cap, dtype=np.float32)
+        self.unemployment_history = np.empty(self._cap, dtype=np.float32)
+        self.inflation_history = np.empty(self._cap, dtype=np.float32)
+        self.trade_balance_history = np.empty(self._cap, dtype=np.float32)
+        self.gdp_history[0] = initial_gdp
+        self.unemployment_history[0] = initial_unemployment
+        self.inflation_history[0] = initial_inflation
+        self.trade_balance_history[0] = 0
+        self._hist_len = 1
+
+    @property
+    def trade_partners(self) -> Dict[str, float]:
+        """贸易伙伴及其关税税率 {国家名称: 关税税率}"""
+        return {name: float(self._partners["tariff"][i]) for name, i in self._name_to_idx.items()}
+
+    @property
+    def export_demand(self) -> Dict[str, float]:
+        """对各国的出口需求 {国家名称: 需求值}"""
+        return {name: float(self._partners["demand"][i]) for name, i in self._name_to_idx.items()}
+
+    @property
+    def imports(self) -> Dict[str, float]:
+        """从各国的进口 {国家名称: 进口额}"""
+        return {name: float(self._partners["imports"][i]) for name, i in self._name_to_idx.items()}
+
+    @property
+    def history_len(self) -> int:
+        """历史数据数组中已写入的条数"""
+        return self._hist_len
+
+    @property
+    def avg_tariff(self) -> float:
+        """对所有贸易伙伴的平均关税税率"""
+        return self._sum_tariff / len(self._partners) if len(self._partners) else 0.0
+
+    @property
+    def total_exports(self) -> float:
+        """总出口额"""
+        return self._sum_demand * 0.8
+
+    @property
+    def total_imports(self) -> float:
+        """总进口额"""
+        return self._sum_imports
+
+    def get_partner_trade(self, partner_name: str) -> Tuple[float, float, float]:
+        """获取与特定贸易伙伴的 (关税税率, 出口需求, 进口额)"""
+        record = self._partners[self._name_to_idx[partner_name]]
+        return float(record["tariff"]), float(record["demand"]), float(record["imports"])
 
     def add_trade_partner(self, partner: 'Country', tariff_rate: float = 0.1):
         """添加贸易伙伴并设置初始关税税率"""
-        self.trade_partners[partner.name] = tariff_rate
-        self.export_demand[partner.name] = random.uniform(50, 100)
-        self.imports[partner.name] = random.uniform(30, 80)
+        idx = self._name_to_idx.get(partner.name)
+        if idx is None:
+            idx = len(self._name_to_idx)
+            self._name_to_idx[partner.name] = idx
+            self._partners = np.resize(self._partners, idx + 1)
+            self._eff_demand = np.resize(self._eff_demand, idx + 1)
+        else:
+            old = self._partners[idx]
+            self._sum_tariff -= float(old["tariff"])
+            self._sum_demand -= float(old["demand"])
+            self._sum_imports -= float(old["imports"])
+        demand = _RNG.uniform(50, 100)
+        imports = _RNG.uniform(30, 80)
+        self._partners[idx] = (tariff_rate, demand, imports)
+        self._eff_demand[idx] = demand * (1 - tariff_rate)
+        self._sum_tariff += tariff_rate
+        self._sum_demand += demand
+        self._sum_imports += imports
 
     def adjust_tariff(self, partner_name: str, new_tariff: float):
         """调整对特定贸易伙伴的关税税率"""
-        if partner_name in self.trade_partners:
-            self.trade_partners[partner_name] = new_tariff
+        idx = self._name_to_idx.get(partner_name)
+        if idx is not None:
+            old_tariff = float(self._partners["tariff"][idx])
+            # 税率没有变化时无需更新缓存
+            if old_tariff == new_tariff:
+                return True
+            self._sum_tariff += new_tariff - old_tariff
+            self._partners["tariff"][idx] = new_tariff
+            self._eff_demand[idx] = self._partners["demand"][idx] * (1 - new_tariff)
             return True
         return False
 
     def simulate_year(self):
         """模拟一年的经济发展"""
-        # 基础经济增长
-        base_gdp_growth = random.uniform(1.0, 3.0)
-        gdp_change = self.gdp * (base_gdp_growth / 100)
-
-        # 计算贸易平衡
-        trade_balance = 0
-        for partner_name, demand in self.export_demand.items():
-            tariff = self.trade_partners.get(partner_name, 0.1)
-            # 关税越高，出口需求越低
-            effective_demand = demand * (1 - tariff)
-            export_value = effective_demand * 0.8  # 出口价值
-            gdp_change += export_value * 0.3  # 出口对GDP的贡献
-
-            # 进口影响
-            import_value = self.imports.get(partner_name, 0)
-            # 关税收入
-            tariff_revenue = import_value * tariff
-            gdp_change += tariff_revenue * 0.1  # 关税收入对GDP的贡献
-
-            trade_balance += export_value - import_value
-
-        # 更新外汇储备
-        self.foreign_reserves += trade_balance
-
-        # 贸易平衡影响GDP
-        if trade_balance > 0:
-            gdp_change += trade_balance * 0.05  # 贸易顺差促进增长
-        else:
-            gdp_change -= abs(trade_balance) * 0.03  # 贸易逆差抑制增长
-
-        # 高关税可能导致国内通货膨胀
-        avg_tariff = sum(self.trade_partners.values()) / len(self.trade_partners) if self.trade_partners else 0
-        inflation_impact = avg_tariff * 2
-        self.inflation += inflation_impact - 0.5  # 随机波动
-
-        # 经济状况影响失业率
-        if gdp_change > 0:
-            unemployment_change = -min(0.5, gdp_change / self.gdp * 0.8)
-        else:
-            unemployment_change = max(0.5, abs(gdp_change) / self.gdp * 1.2)
-        self.unemployment += unemployment_change
-
-        # 更新GDP
-        self.gdp += gdp_change
-
-        # 调整进口需求
-        for partner_name in self.imports:
-            # 经济增长会增加进口需求
-            self.imports[partner_name] *= (1 + gdp_change / self.gdp * 0.7)
-            # 通货膨胀会抑制进口需求
-            self.imports[partner_name] /= (1 + self.inflation / 100 * 0.5)
-
-        # 调整出口需求（贸易伙伴的反馈）
-        for partner_name in self.export_demand:
-            # 如果对某国关税过高，可能导致报复性关税
-            if self.trade_partners[partner_name] > 0.25:
-                retaliation_chance = min(0.7, (self.trade_partners[partner_name] - 0.2) * 5)
-                if random.random() < retaliation_chance:
-                    self.export_demand[partner_name] *= 0.8
-                    return f"警告: {partner_name}因您的高关税实施了报复性贸易限制！"
+        n = len(self._name_to_idx)
+        rand_u = _RNG.random(n + 1)
+        retaliated = np.zeros(n, dtype=np.bool_)
+        gdp, inflation, unemployment, reserves, trade_balance, total_demand, total_imports = _sim_core(
+            self.gdp, self.inflation, self.unemployment, self.foreign_reserves,
+            self.avg_tariff, self._sum_demand, self._sum_imports,
+            self._partners["tariff"], self._partners["demand"], self._eff_demand,
+            self._partners["imports"], rand_u, retaliated)
+        self.gdp = float(gdp)
+        self.inflation = float(inflation)
+        self.unemployment = float(unemployment)
+        self.foreign_reserves = float(reserves)
+        trade_balance = float(trade_balance)
+        self._sum_demand = float(total_demand)
+        self._sum_imports = float(total_imports)
+
+        messages = []
+        if retaliated.any():
+            partner_names = list(self._name_to_idx)
+            for idx in np.flatnonzero(retaliated):
+                messages.append(f"警告: {partner_names[idx]}因您的高关税实施了报复性贸易限制！")
 
         # 随机事件
         event_message = self._handle_random_event()
-
-        # 更新历史数据
-        self.gdp_history.append(self.gdp)
-        self.unemployment_history.append(self.unemployment)
-        self.inflation_history.append(self.inflation)
-        self.trade_balance_history.append(trade_balance)
+        if event_message:
+            messages.append(event_message)
+
+        # 更新历史数据，容量不足时翻倍
+        if self._hist_len == self._cap:
+            self._cap *= 2
+            self.gdp_history = np.resize(self.gdp_history, self._cap)
+            self.unemployment_history = np.resize(self.unemployment_history, self._cap)
+            self.inflation_history = np.resize(self.inflation_history, self._cap)
+            self.trade_balance_history = np.resize(self.trade_balance_history, self._cap)
+        i = self._hist_len
+        self.gdp_history[i] = self.gdp
+        self.unemployment_history[i] = self.unemployment
+        self.inflation_history[i] = self.inflation
+        self.trade_balance_history[i] = trade_balance
+        self._hist_len += 1
 
         # 更新年份
         self.year += 1
 
-        return event_message
+        return "\n".join(messages) if messages else None
 
     def _handle_random_event(self):
         """处理随机经济事件"""
-        events = [
-            ("全球经济繁荣", 0.1, lambda: (self.gdp * random.uniform(0.02, 0.04), -0.7, -0.5)),
-            ("全球经济衰退", 0.1, lambda: (-self.gdp * random.uniform(0.01, 0.03), 0.9, 0.8)),
-            ("技术突破", 0.15, lambda: (self.gdp * random.uniform(0.015, 0.035), -0.5, -0.3)),
-            ("自然灾害", 0.05, lambda: (-self.gdp * random.uniform(0.01, 0.02), 0.4, 0.3)),
-            ("能源价格暴跌", 0.1, lambda: (self.gdp * random.uniform(0.01, 0.025), -0.3, -1.2)),
-            ("能源价格飙升", 0.1, lambda: (-self.gdp * random.uniform(0.01, 0.02), 0.5, 1.5)),
-            (None, 0.45, lambda: (0, 0, 0))  # 无事件
-        ]
-
-        weights = [event[1] for event in events]
-        event = random.choices(events, weights=weights)[0]
+        idx = int(np.searchsorted(self._EVENT_CDF, _RNG.random(), side="right"))
+        name = self._EVENT_NAMES[idx]
 
-        if event[0]:
-            gdp_effect, unemp_effect, infl_effect = event[2]()
-            self.gdp += gdp_effect
-            self.unemployment += unemp_effect
-            self.inflation += infl_effect
-            return f"事件: {event[0]}!"
+        if name:
+            gdp_ratio = _RNG.uniform(self._EVENT_GDP_LO[idx], self._EVENT_GDP_HI[idx])
+            self.gdp += float(self._EVENT_GDP_SIGN[idx]) * self.gdp * gdp_ratio
+            self.unemployment += float(self._EVENT_UNEMP[idx])
+            self.inflation += float(self._EVENT_INFL[idx])
+            return f"事件: {name}!"
 
         return None
 
@@ -157,8 +322,8 @@ class Country:
         summary += f"外汇储备: {self.foreign_reserves:.2f} 十亿美元\n"
 
         trade_summary = "\n贸易情况:\n"
-        total_exports = sum(self.export_demand.values()) * 0.8
-        total_imports = sum(self.imports.values())
+        total_exports = self.total_exports
+        total_imports = self.total_imports
         trade_balance = total_exports - total_imports
 
         trade_summary += f"总出口: {total_exports:.2f} 十亿美元\n"
@@ -171,6 +336,8 @@ class Country:
 class TradeSimulationGUI:
     """贸易模拟游戏图形界面"""
 
+    GAME_YEARS = 5  # 执政年数，模拟到第 GAME_YEARS + 1 年时游戏结束
+
     def __init__(self, root):
         self.root = root
         self.root.title("国家贸易模拟器")
@@ -192,6 +359,8 @@ class TradeSimulationGUI:
 
         # 游戏状态
         self.game_over = False
+        # 连续模拟多年时，每模拟 disp_skip 年才刷新一次界面
+        self.disp_skip = 2
 
         # 创建UI
         self._create_widgets()
@@ -271,13 +440,19 @@ class TradeSimulationGUI:
                                        font=("SimHei", 12), command=self._simulate_next_year)
         self.next_year_btn.pack(side=tk.RIGHT, padx=10, pady=5)
 
+        self.fast_forward_btn = tk.Button(self.button_frame, text="快进5年",
+                                          bg=self.button_color, fg=self.button_text_color,
+                                          font=("SimHei", 12),
+                                          command=lambda: self._simulate_next_year(5))
+        self.fast_forward_btn.pack(side=tk.RIGHT, padx=10, pady=5)
+
         self.help_btn = tk.Button(self.button_frame, text="游戏帮助",
                                   bg="#6c757d", fg="white",
                                   font=("SimHei", 12), command=self._show_help)
         self.help_btn.pack(side=tk.RIGHT, padx=10, pady=5)
 
-        # 事件日志
-        self.event_log = []
+        # 事件日志（只保留最近500条）
+        self.event_log = deque(maxlen=500)
 
     def _create_overview_tab(self):
         """创建经济概览标签页"""
@@ -351,11 +526,67 @@ class TradeSimulationGUI:
                                           font=("SimHei", 14), bg=self.bg_color)
         self.charts_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # 创建图表
-        self.fig, (self.ax1, self.ax2) = plt.subplots(2, 1, figsize=(6, 8), dpi=100)
+        # 创建图表，控件完成布局后由<Configure>按实际像素大小调整
+        # 直接创建Figure，不经过pyplot的全局图形管理
+        # layout="tight" 使每次完整重绘都按当前刻度标签和尺寸重新计算边距
+        self.fig = Figure(figsize=(6, 8), dpi=100, layout="tight")
+        self.ax1 = self.fig.add_subplot(2, 1, 1)
+        self.ax2 = self.fig.add_subplot(2, 1, 2)
+        self._ax1_twin = self.ax1.twinx()
+        self._ax2_twin = self.ax2.twinx()
+
+        # 曲线只创建一次，之后每年只更新数据；曲线为动画对象，通过blit单独重绘
+        # GDP和贸易平衡图表
+        self._line_gdp, = self.ax1.plot([], [], 'b-', label='GDP', animated=True)
+        self.ax1.set_ylabel('GDP (十亿美元)', color='b')
+        self.ax1.tick_params(axis='y', labelcolor='b')
+
+        self._line_trade_balance, = self._ax1_twin.plot([], [], 'r-', label='贸易平衡', animated=True)
+        self._ax1_twin.set_ylabel('贸易平衡 (十亿美元)', color='r')
+        self._ax1_twin.tick_params(axis='y', labelcolor='r')
+
+        self.ax1.set_title('GDP与贸易平衡趋势')
+        self.ax1.grid(True, linestyle='--', alpha=0.7)
+
+        # 失业率和通货膨胀率图表
+        self._line_unemployment, = self.ax2.plot([], [], 'g-', label='失业率', animated=True)
+        self.ax2.set_ylabel('失业率 (%)', color='g')
+        self.ax2.tick_params(axis='y', labelcolor='g')
+
+        self._line_inflation, = self._ax2_twin.plot([], [], 'm-', label='通货膨胀率', animated=True)
+        self._ax2_twin.set_ylabel('通货膨胀率 (%)', color='m')
+        self._ax2_twin.tick_params(axis='y', labelcolor='m')
+
+        self.ax2.set_title('失业率与通货膨胀率趋势')
+        self.ax2.set_xlabel('年份')
+        self.ax2.grid(True, linestyle='--', alpha=0.7)
+
+        # x轴固定为整个任期，每年更新时无需重排x轴
+        self.ax1.set_xlim(1, self.GAME_YEARS + 1)
+        self.ax2.set_xlim(1, self.GAME_YEARS + 1)
+
+        # 各曲线的年度最大变化估计值 (绝对值, 相对当前值的比例)，用于预留y轴空间：
+        # GDP每年最多变化约10%，贸易平衡约30，失业率约0.6，通货膨胀率约1.0
+        self._chart_series = (
+            (self.ax1, self._line_gdp, 0.0, 0.1),
+            (self._ax1_twin, self._line_trade_balance, 30.0, 0.0),
+            (self.ax2, self._line_unemployment, 0.6, 0.0),
+            (self._ax2_twin, self._line_inflation, 1.0, 0.0),
+        )
+
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.charts_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+        # 替换matplotlib默认的<Configure>处理：尺寸真正变化后延迟200毫秒再重排图表
+        self._chart_size = None
+        self._chart_resize_job = None
+        self.canvas.get_tk_widget().bind("<Configure>", self._on_chart_configure)
+
+        # 完整重绘后缓存不含曲线的背景，用于blit
+        self._bg1 = None
+        self._bg2 = None
+        self.canvas.mpl_connect("draw_event", self._on_chart_draw)
+
     def _create_policy_tab(self):
         """创建贸易政策标签页"""
         # 关税调整区域
@@ -373,7 +604,8 @@ class TradeSimulationGUI:
                              font=("SimHei", 12), bg=self.card_color)
             label.pack(side=tk.LEFT, padx=10)
 
-            tariff_var = tk.DoubleVar(value=self.player_country.trade_partners[partner.name] * 100)
+            tariff, _, _ = self.player_country.get_partner_trade(partner.name)
+            tariff_var = tk.DoubleVar(value=tariff * 100)
             scale = tk.Scale(frame, from_=0, to=50, orient=tk.HORIZONTAL,
                              resolution=1, length=200, bg=self.card_color)
             scale.config(variable=tariff_var)
@@ -424,6 +656,11 @@ class TradeSimulationGUI:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.partners_tree.pack(fill=tk.BOTH, expand=True)
 
+        # 每个贸易伙伴固定一行，之后只原地更新数据
+        for partner in self.trade_partners:
+            self.partners_tree.insert("", tk.END, iid=partner.name,
+                                      values=(partner.name, "-", "-", "-", "-"))
+
     def _create_log_tab(self):
         """创建事件日志标签页"""
         self.log_text = scrolledtext.ScrolledText(self.log_frame, wrap=tk.WORD,
@@ -443,27 +680,25 @@ class TradeSimulationGUI:
         self.reserves_value.config(text=f"{self.player_country.foreign_reserves:.2f} 十亿美元")
 
         # 计算并更新贸易平衡
-        total_exports = sum(self.player_country.export_demand.values()) * 0.8
-        total_imports = sum(self.player_country.imports.values())
+        total_exports = self.player_country.total_exports
+        total_imports = self.player_country.total_imports
         trade_balance = total_exports - total_imports
         self.trade_balance_value.config(text=f"{trade_balance:+.2f} 十亿美元")
 
-        # 更新关税政策标签页
         for partner_name, widgets in self.tariff_widgets.items():
-            widgets["var"].set(self.player_country.trade_partners[partner_name] * 100)
-
-        # 更新贸易伙伴标签页
-        self.partners_tree.delete(*self.partners_tree.get_children())
-        for partner_name in self.player_country.trade_partners:
-            tariff = self.player_country.trade_partners[partner_name] * 100
-            exports = self.player_country.export_demand[partner_name] * 0.8
-            imports = self.player_country.imports.get(partner_name, 0)
+            tariff, demand, imports = self.player_country.get_partner_trade(partner_name)
+
+            # 更新关税政策标签页
+            widgets["var"].set(tariff * 100)
+
+            # 更新贸易伙伴标签页
+            exports = demand * 0.8
             balance = exports - imports
 
-            # 添加到表格
-            self.partners_tree.insert("", tk.END, values=(
+            # 更新表格中对应的行
+            self.partners_tree.item(partner_name, values=(
                 partner_name,
-                f"{tariff:.1f}%",
+                f"{tariff * 100:.1f}%",
                 f"{exports:.2f}B",
                 f"{imports:.2f}B",
                 f"{balance:+.2f}B"
@@ -472,45 +707,78 @@ class TradeSimulationGUI:
         # 更新图表
         self._update_charts()
 
+        # 所有控件更新完成后统一重绘一次
+        self.root.update_idletasks()
+
     def _update_charts(self):
         """更新经济趋势图表"""
-        # 清除现有图表
-        self.ax1.clear()
-        self.ax2.clear()
-
-        # 年份列表
-        years = list(range(1, self.player_country.year + 1))
-
-        # GDP和贸易平衡图表
-        self.ax1.plot(years, self.player_country.gdp_history, 'b-', label='GDP')
-        self.ax1.set_ylabel('GDP (十亿美元)', color='b')
-        self.ax1.tick_params(axis='y', labelcolor='b')
-
-        ax1_twin = self.ax1.twinx()
-        ax1_twin.plot(years, self.player_country.trade_balance_history, 'r-', label='贸易平衡')
-        ax1_twin.set_ylabel('贸易平衡 (十亿美元)', color='r')
-        ax1_twin.tick_params(axis='y', labelcolor='r')
-
-        self.ax1.set_title('GDP与贸易平衡趋势')
-        self.ax1.grid(True, linestyle='--', alpha=0.7)
-
-        # 失业率和通货膨胀率图表
-        self.ax2.plot(years, self.player_country.unemployment_history, 'g-', label='失业率')
-        self.ax2.set_ylabel('失业率 (%)', color='g')
-        self.ax2.tick_params(axis='y', labelcolor='g')
-
-        ax2_twin = self.ax2.twinx()
-        ax2_twin.plot(years, self.player_country.inflation_history, 'm-', label='通货膨胀率')
-        ax2_twin.set_ylabel('通货膨胀率 (%)', color='m')
-        ax2_twin.tick_params(axis='y', labelcolor='m')
-
-        self.ax2.set_title('失业率与通货膨胀率趋势')
-        self.ax2.set_xlabel('年份')
-        self.ax2.grid(True, linestyle='--', alpha=0.7)
+        # 只取历史数组中已写入的部分，每条数据对应一年
+        n = self.player_country.history_len
+        years = np.arange(1, n + 1)
+
+        self._line_gdp.set_data(years, self.player_country.gdp_history[:n])
+        self._line_trade_balance.set_data(years, self.player_country.trade_balance_history[:n])
+        self._line_unemployment.set_data(years, self.player_country.unemployment_history[:n])
+        self._line_inflation.set_data(years, self.player_country.inflation_history[:n])
+
+        # 任期内还要模拟的年数
+        remaining = self.GAME_YEARS + 1 - n
+
+        limits_changed = False
+        for ax, line, abs_step, rel_step in self._chart_series:
+            data = np.asarray(line.get_ydata(), dtype=np.float64)
+            lo, hi = ax.get_ylim()
+            # 已设置过范围且数据仍在范围内时保持y轴不变，曲线可以直接blit
+            if not ax.get_autoscaley_on() and data.min() >= lo and data.max() <= hi:
+                continue
+            # 超出时按剩余年数 × 年度最大变化预留空间，使本任期内尽量不再重排；
+            # 年度变化取已观测到的最大值与估计值中较大者
+            step = float(np.abs(np.diff(data)).max()) if n > 1 else 0.0
+            step = max(step, abs_step, rel_step * abs(float(data[-1])))
+            pad = max(remaining * step, 0.05 * max(abs(float(data.max())), 1.0))
+            ax.set_ylim(data.min() - pad, data.max() + pad)
+            limits_changed = True
+
+        # 坐标轴范围变化时需要完整重绘
+        if self._bg1 is None or limits_changed:
+            self.canvas.draw_idle()
+            return
 
-        # 调整布局
-        self.fig.tight_layout()
-        self.canvas.draw()
+        # 范围不变时恢复背景并只重绘曲线
+        self.canvas.restore_region(self._bg1)
+        self.canvas.restore_region(self._bg2)
+        self._draw_chart_lines()
+        self.canvas.blit(self.ax1.bbox)
+        self.canvas.blit(self.ax2.bbox)
+
+    def _on_chart_configure(self, event):
+        """图表控件尺寸变化时延迟重排图表"""
+        size = (event.width, event.height)
+        if size == self._chart_size:
+            return
+        self._chart_size = size
+
+        if self._chart_resize_job is not None:
+            self.root.after_cancel(self._chart_resize_job)
+        self._chart_resize_job = self.root.after(200, self._resize_chart, event)
+
+    def _resize_chart(self, event):
+        """按控件新尺寸调整图表大小"""
+        self._chart_resize_job = None
+        self.canvas.resize(event)
+
+    def _on_chart_draw(self, event):
+        """图表完整重绘后缓存背景并画出曲线"""
+        self._bg1 = self.canvas.copy_from_bbox(self.ax1.bbox)
+        self._bg2 = self.canvas.copy_from_bbox(self.ax2.bbox)
+        self._draw_chart_lines()
+
+    def _draw_chart_lines(self):
+        """绘制所有动画曲线"""
+        self.ax1.draw_artist(self._line_gdp)
+        self._ax1_twin.draw_artist(self._line_trade_balance)
+        self.ax2.draw_artist(self._line_unemployment)
+        self._ax2_twin.draw_artist(self._line_inflation)
 
     def _apply_tariff(self, partner_name, tariff_var):
         """应用关税调整"""
@@ -525,45 +793,67 @@ class TradeSimulationGUI:
         """记录事件到日志"""
         self.event_log.append(f"第{self.player_country.year}年: {message}")
 
-        # 更新日志显示
+        # 更新日志显示（只追加新的一条）
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.delete(1.0, tk.END)
-        for event in self.event_log:
-            self.log_text.insert(tk.END, event + "\n\n")
+        self.log_text.insert(tk.END, self.event_log[-1] + "\n\n")
+        # 日志超过1000行时删除最早的至少100行，限制控件大小；
+        # 每条记录后跟一个空行，删除到第100行之后的第一个空行为止，不会截断记录
+        if int(self.log_text.index("end-1c").split(".")[0]) > 1000:
+            line = 100
+            while self.log_text.get(f"{line}.0", f"{line}.end"):
+                line += 1
+            self.log_text.delete("1.0", f"{line + 1}.0")
         self.log_text.config(state=tk.DISABLED)
         self.log_text.see(tk.END)
 
-    def _simulate_next_year(self):
-        """模拟下一年"""
+    def _simulate_next_year(self, n_years: int = 1):
+        """开始模拟接下来的 n_years 年"""
         if self.game_over:
             messagebox.showinfo("游戏结束", "游戏已结束，请重新启动。")
             return
 
-        # 显示处理中消息
+        # 显示处理中消息（只刷新界面，不处理用户事件，避免重入）
         self.next_year_btn.config(state=tk.DISABLED, text="处理中...")
-        self.root.update()
+        self.fast_forward_btn.config(state=tk.DISABLED)
+        self.root.update_idletasks()
 
-        # 模拟一年
-        event_message = self.player_country.simulate_year()
+        # 交给事件循环排队执行，界面保持响应
+        self.root.after(1, self._run_years, n_years)
 
-        # 记录事件
-        if event_message:
-            self._log_event(event_message)
+    def _run_years(self, n_years: int):
+        """依次模拟 n_years 年并刷新界面"""
+        for i in range(n_years):
+            # 模拟一年
+            event_message = self.player_country.simulate_year()
+
+            # 记录事件
+            if event_message:
+                self._log_event(event_message)
+
+            # 检查游戏是否结束
+            if self.player_country.year > self.GAME_YEARS:
+                break
+
+            self._log_event("年度经济报告已更新")
+
+            # 中间年份按本次已模拟的年数每 disp_skip 年刷新，最后一年在循环结束后统一刷新
+            if i < n_years - 1 and (i + 1) % self.disp_skip == 0:
+                self._update_display()
 
         # 更新显示
         self._update_display()
 
-        # 检查游戏是否结束
-        if self.player_country.year > 5:
+        if self.player_country.year > self.GAME_YEARS:
             self._end_game()
         else:
-            self._log_event("年度经济报告已更新")
             self.next_year_btn.config(state=tk.NORMAL, text="进入下一年")
+            self.fast_forward_btn.config(state=tk.NORMAL)
 
     def _end_game(self):
         """结束游戏并显示结果"""
         self.game_over = True
         self.next_year_btn.config(state=tk.DISABLED, text="游戏结束")
+        self.fast_forward_btn.config(state=tk.DISABLED)
 
         # 计算总体变化
         initial_gdp = 1000.0
@@ -634,7 +924,8 @@ class TradeSimulationGUI:
 
 3. 管理贸易伙伴: 在"贸易伙伴"标签页中，你可以查看与各国的贸易情况。
 
-4. 进入下一年: 点击"进入下一年"按钮来模拟一年的经济发展。
+4. 进入下一年: 点击"进入下一年"按钮来模拟一年的经济发展，
+   点击"快进5年"按钮可以连续模拟多年。
 
 特殊事件:
 游戏中可能会发生各种随机事件，如全球经济繁荣或衰退、技术突破、自然灾害等，